@@ -0,0 +1,112 @@
+# Decision Ecosystem — execution-orchestration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""
+Cold-start benchmark: package import cost and first ``execute()`` latency.
+
+Each run is a fresh interpreter (cold start, as in a short-lived worker):
+- ``python -X importtime -c "import execution_orchestration_core"`` → cumulative import time
+- a child script timing lazy ``execute`` resolution + the first ``execute()`` call
+  (``decision_schema`` is imported beforehand: callers already own it to build FinalDecision)
+
+Usage:
+    python benchmarks/bench_startup.py --runs 10
+    python benchmarks/bench_startup.py --max-import-us 5000 --max-first-execute-us 50000
+
+Exits 1 if a median exceeds its threshold. CI runs this with generous thresholds
+(well above local medians, to absorb runner noise) to catch order-of-magnitude
+cold-start regressions; ``tests/test_invariant_exe_startup.py`` separately guards
+which modules are imported.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+PACKAGE = "execution_orchestration_core"
+
+FIRST_EXECUTE_SCRIPT = """
+import json, time
+from decision_schema.types import Action, FinalDecision
+
+t0 = time.perf_counter()
+import execution_orchestration_core as eoc
+t1 = time.perf_counter()
+report = eoc.execute(
+    FinalDecision(action=Action.ACT, allowed=True, reasons=["bench"]),
+    {},
+    eoc.ExecutionPolicy(),
+    lambda _action, _context: (True, None),
+)
+t2 = time.perf_counter()
+assert report.success_count == 1
+print(json.dumps({"import_us": (t1 - t0) * 1e6, "first_execute_us": (t2 - t1) * 1e6}))
+"""
+
+
+def import_time_us() -> int:
+    """Cumulative ``-X importtime`` microseconds for the package import (fresh interpreter)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {PACKAGE}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Line format: "import time: <self us> | <cumulative us> | <indent><module>"
+    for line in proc.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == PACKAGE:
+            return int(parts[1])
+    raise RuntimeError(f"{PACKAGE} not found in -X importtime output")
+
+
+def first_execute_us() -> dict[str, float]:
+    """Lazy-import + first execute() latency in microseconds (fresh interpreter)."""
+    proc = subprocess.run(
+        [sys.executable, "-c", FIRST_EXECUTE_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--max-import-us", type=float, default=None)
+    parser.add_argument("--max-first-execute-us", type=float, default=None)
+    args = parser.parse_args()
+
+    import_samples = [import_time_us() for _ in range(args.runs)]
+    execute_samples = [first_execute_us()["first_execute_us"] for _ in range(args.runs)]
+
+    result = {
+        "runs": args.runs,
+        "import_us_median": statistics.median(import_samples),
+        "import_us_min": min(import_samples),
+        "first_execute_us_median": statistics.median(execute_samples),
+        "first_execute_us_min": min(execute_samples),
+    }
+    print(json.dumps(result, indent=2))
+
+    failed = False
+    if args.max_import_us is not None and result["import_us_median"] > args.max_import_us:
+        print(f"FAIL: import median {result['import_us_median']}us > {args.max_import_us}us")
+        failed = True
+    if (
+        args.max_first_execute_us is not None
+        and result["first_execute_us_median"] > args.max_first_execute_us
+    ):
+        print(
+            f"FAIL: first execute median {result['first_execute_us_median']:.0f}us"
+            f" > {args.max_first_execute_us}us"
+        )
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,103 @@
 # Decision Ecosystem — execution-orchestration-core
 # Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
 # SPDX-License-Identifier: MIT
-"""Execution Orchestration Core: Domain-agnostic action execution runtime."""
+"""Execution Orchestration Core: Domain-agnostic action execution runtime.
+
+Public names are re-exported lazily (module ``__getattr__``): ``import
+execution_orchestration_core`` loads only the version, and each submodule is
+imported on first attribute access (minimal cold start for short-lived workers).
+"""
 
 from execution_orchestration_core.version import __version__
 
-__all__ = ["__version__"]
+# Public name -> submodule (imported on first access)
+_LAZY_EXPORTS: dict[str, str] = {
+    "execute": "orchestrator",
+    "ActionExecutor": "orchestrator",
+    "ExecutionPolicy": "policies",
+    "RetryPolicy": "policies",
+    "TimeoutPolicy": "policies",
+    "IdempotencyPolicy": "policies",
+    "LoadSheddingPolicy": "policies",
+    "ExecutionAttempt": "model",
+    "ExecutionPlan": "model",
+    "ExecutionReport": "model",
+    "ExecutionStatus": "model",
+    "redact_execution_log": "redaction",
+    "add_execution_trace": "trace",
+    "CoordinationBackend": "coordination",
+    "CoordinationError": "coordination",
+    "InMemoryLeaseBackend": "coordination",
+    "FileLeaseBackend": "coordination",
+    "TcpLeaseBackend": "coordination",
+    "PrefetchingBackend": "coordination",
+    "LeaseServer": "coordination",
+}
+
+# Literal (not derived from _LAZY_EXPORTS) so linters see the re-exports; kept in sync by tests
+__all__ = [
+    "__version__",
+    "execute",
+    "ActionExecutor",
+    "ExecutionPolicy",
+    "RetryPolicy",
+    "TimeoutPolicy",
+    "IdempotencyPolicy",
+    "LoadSheddingPolicy",
+    "ExecutionAttempt",
+    "ExecutionPlan",
+    "ExecutionReport",
+    "ExecutionStatus",
+    "redact_execution_log",
+    "add_execution_trace",
+    "CoordinationBackend",
+    "CoordinationError",
+    "InMemoryLeaseBackend",
+    "FileLeaseBackend",
+    "TcpLeaseBackend",
+    "PrefetchingBackend",
+    "LeaseServer",
+]
+
+TYPE_CHECKING = False  # avoid importing typing at startup; type checkers treat this as True
+if TYPE_CHECKING:
+    from execution_orchestration_core.coordination import (
+        CoordinationBackend,
+        CoordinationError,
+        FileLeaseBackend,
+        InMemoryLeaseBackend,
+        LeaseServer,
+        PrefetchingBackend,
+        TcpLeaseBackend,
+    )
+    from execution_orchestration_core.model import (
+        ExecutionAttempt,
+        ExecutionPlan,
+        ExecutionReport,
+        ExecutionStatus,
+    )
+    from execution_orchestration_core.orchestrator import ActionExecutor, execute
+    from execution_orchestration_core.policies import (
+        ExecutionPolicy,
+        IdempotencyPolicy,
+        LoadSheddingPolicy,
+        RetryPolicy,
+        TimeoutPolicy,
+    )
+    from execution_orchestration_core.redaction import redact_execution_log
+    from execution_orchestration_core.trace import add_execution_trace
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value  # cache: later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_EXPORTS})
@@ -0,0 +1,462 @@
+# Decision Ecosystem — execution-orchestration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Multi-worker idempotency coordination: lease backends for claiming idempotency keys."""
+
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+# Lease table: key -> [owner_id, expires_ms] (list, not tuple: JSON round-trip stable)
+LeaseTable = dict[str, list[Any]]
+
+_PROCESS_TOKEN = os.urandom(6).hex()
+
+
+class CoordinationError(RuntimeError):
+    """Coordination backend failure (orchestrator treats as fail-closed, INV-EXE-3)."""
+
+
+def default_owner_id() -> str:
+    """Return a per-process owner id (unique across hosts and PID reuse)."""
+    return f"{os.getpid()}-{_PROCESS_TOKEN}"
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def _claim_leases(
+    leases: LeaseTable, keys: Sequence[str], owner_id: str, ttl_ms: int, now_ms: int
+) -> list[bool]:
+    """Claim keys in a lease table (only free or expired keys; a live lease is never re-claimed)."""
+    claimed = []
+    for key in keys:
+        lease = leases.get(key)
+        if lease is None or lease[1] <= now_ms:
+            leases[key] = [owner_id, now_ms + ttl_ms]
+            claimed.append(True)
+        else:
+            claimed.append(False)
+    return claimed
+
+
+def _renew_leases(
+    leases: LeaseTable, keys: Sequence[str], owner_id: str, ttl_ms: int, now_ms: int
+) -> list[bool]:
+    """Extend live leases held by owner_id to now + ttl_ms (expired or foreign → False)."""
+    renewed = []
+    for key in keys:
+        lease = leases.get(key)
+        if lease is not None and lease[0] == owner_id and lease[1] > now_ms:
+            lease[1] = max(lease[1], now_ms + ttl_ms)
+            renewed.append(True)
+        else:
+            renewed.append(False)
+    return renewed
+
+
+def _release_leases(leases: LeaseTable, keys: Sequence[str], owner_id: str) -> None:
+    """Release keys held by owner_id (leases held by others are left untouched)."""
+    for key in keys:
+        lease = leases.get(key)
+        if lease is not None and lease[0] == owner_id:
+            del leases[key]
+
+
+class CoordinationBackend(ABC):
+    """
+    Lease backend for claiming idempotency keys across workers.
+
+    A claim succeeds only if the key is free or its lease has expired: a live
+    lease is never re-claimed, even by its own owner, so a redelivered or
+    concurrently delivered decision in the same process is not executed twice.
+    Extending a lease held by ``owner_id`` is an explicit ``renew``. Batch
+    methods are the primitive so that network backends cost one round trip
+    per batch.
+    """
+
+    def __init__(self, owner_id: str | None = None) -> None:
+        self.owner_id = owner_id or default_owner_id()
+
+    @abstractmethod
+    def claim_many(self, keys: Sequence[str], ttl_ms: int) -> list[bool]:
+        """
+        Claim keys with a lease of ttl_ms.
+
+        Args:
+            keys: Idempotency keys to claim
+            ttl_ms: Lease duration in milliseconds
+
+        Returns:
+            Claim result per key (same order as keys)
+        """
+
+    @abstractmethod
+    def renew_many(self, keys: Sequence[str], ttl_ms: int) -> list[bool]:
+        """
+        Extend live leases held by this owner to expire ttl_ms from now.
+
+        Args:
+            keys: Idempotency keys to renew
+            ttl_ms: Lease duration in milliseconds (from now)
+
+        Returns:
+            Renew result per key (False if expired or held by another owner)
+        """
+
+    @abstractmethod
+    def release_many(self, keys: Sequence[str]) -> None:
+        """Release leases held by this owner (no-op for keys held by others)."""
+
+    def claim(self, key: str, ttl_ms: int) -> bool:
+        """Claim a single key (see claim_many)."""
+        return self.claim_many([key], ttl_ms)[0]
+
+    def renew(self, key: str, ttl_ms: int) -> bool:
+        """Renew a single key (see renew_many)."""
+        return self.renew_many([key], ttl_ms)[0]
+
+    def release(self, key: str) -> None:
+        """Release a single key (see release_many)."""
+        self.release_many([key])
+
+
+class InMemoryLeaseBackend(CoordinationBackend):
+    """Thread-safe single-process lease backend (tests, single-worker deployments)."""
+
+    def __init__(self, owner_id: str | None = None, clock: Callable[[], int] | None = None) -> None:
+        super().__init__(owner_id)
+        self._clock = clock or _now_ms
+        self._leases: LeaseTable = {}
+        self._lock = threading.Lock()
+
+    def claim_many(self, keys: Sequence[str], ttl_ms: int) -> list[bool]:
+        with self._lock:
+            return _claim_leases(self._leases, keys, self.owner_id, ttl_ms, self._clock())
+
+    def renew_many(self, keys: Sequence[str], ttl_ms: int) -> list[bool]:
+        with self._lock:
+            return _renew_leases(self._leases, keys, self.owner_id, ttl_ms, self._clock())
+
+    def release_many(self, keys: Sequence[str]) -> None:
+        with self._lock:
+            _release_leases(self._leases, keys, self.owner_id)
+
+
+class FileLeaseBackend(CoordinationBackend):
+    """
+    Multi-process lease backend for workers on one host (POSIX ``fcntl.flock``).
+
+    The lease table is a JSON file guarded by an exclusive lock on ``<path>.lock``;
+    a batch is one lock/read/write cycle. Expired leases are pruned on each write.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        owner_id: str | None = None,
+        clock: Callable[[], int] | None = None,
+    ) -> None:
+        super().__init__(owner_id)
+        self.path = os.fspath(path)
+        self._clock = clock or _now_ms
+
+    @contextmanager
+    def _locked_table(self) -> Iterator[LeaseTable]:
+        import fcntl  # POSIX only; deferred so the module imports everywhere
+
+        with open(self.path + ".lock", "a+b") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                try:
+                    with open(self.path, encoding="utf-8") as f:
+                        leases: LeaseTable = json.load(f)
+                except FileNotFoundError:
+                    leases = {}
+                yield leases
+                now_ms = self._clock()
+                live = {k: v for k, v in leases.items() if v[1] > now_ms}
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(live, f, sort_keys=True)
+                os.replace(tmp_path, self.path)
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def claim_many(self, keys: Sequence[str], ttl_ms: int) -> list[bool]:
+        with self._locked_table() as leases:
+            return _claim_leases(leases, keys, self.owner_id, ttl_ms, self._clock())
+
+    def renew_many(self, keys: Sequence[str], ttl_ms: int) -> list[bool]:
+        with self._locked_table() as leases:
+            return _renew_leases(leases, keys, self.owner_id, ttl_ms, self._clock())
+
+    def release_many(self, keys: Sequence[str]) -> None:
+        with self._locked_table() as leases:
+            _release_leases(leases, keys, self.owner_id)
+
+
+class TcpLeaseBackend(CoordinationBackend):
+    """
+    Network lease backend speaking newline-delimited JSON over TCP.
+
+    Protocol (one line each way per batch):
+    - claim: ``{"op": "claim", "keys": [...], "owner": str, "ttl_ms": int}``
+      → ``{"ok": true, "claimed": [bool, ...]}``
+    - renew: ``{"op": "renew", "keys": [...], "owner": str, "ttl_ms": int}``
+      → ``{"ok": true, "renewed": [bool, ...]}``
+    - release: ``{"op": "release", "keys": [...], "owner": str}`` → ``{"ok": true}``
+
+    The connection is opened lazily and reused; ``LeaseServer`` is a local stand-in.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        owner_id: str | None = None,
+        timeout_s: float = 5.0,
+    ) -> None:
+        super().__init__(owner_id)
+        self.host = host
+        self.port = port
+        self.timeout_s = timeout_s
+        self._sock: socket.socket | None = None
+        self._reader: Any = None
+        self._lock = threading.Lock()
+
+    def _request(self, payload: dict[str, Any]) -> dict[str, Any]:
+        data = (json.dumps(payload) + "\n").encode("utf-8")
+        with self._lock:
+            try:
+                if self._sock is None:
+                    self._sock = socket.create_connection(
+                        (self.host, self.port), timeout=self.timeout_s
+                    )
+                    self._reader = self._sock.makefile("rb")
+                self._sock.sendall(data)
+                line = self._reader.readline()
+            except OSError:
+                self._close_locked()
+                raise
+            if not line:
+                self._close_locked()
+                raise CoordinationError("connection_closed")
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise CoordinationError(str(response.get("error", "request_failed")))
+        return response
+
+    def _batch(self, op: str, field: str, keys: Sequence[str], ttl_ms: int) -> list[bool]:
+        if not keys:
+            return []
+        response = self._request(
+            {"op": op, "keys": list(keys), "owner": self.owner_id, "ttl_ms": ttl_ms}
+        )
+        results = response.get(field)
+        if not isinstance(results, list) or len(results) != len(keys):
+            raise CoordinationError("malformed_response")
+        return [bool(r) for r in results]
+
+    def claim_many(self, keys: Sequence[str], ttl_ms: int) -> list[bool]:
+        return self._batch("claim", "claimed", keys, ttl_ms)
+
+    def renew_many(self, keys: Sequence[str], ttl_ms: int) -> list[bool]:
+        return self._batch("renew", "renewed", keys, ttl_ms)
+
+    def release_many(self, keys: Sequence[str]) -> None:
+        if keys:
+            self._request({"op": "release", "keys": list(keys), "owner": self.owner_id})
+
+    def _close_locked(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+        if self._sock is not None:
+            self._sock.close()
+        self._sock = None
+        self._reader = None
+
+    def close(self) -> None:
+        """Close the connection (reopened on next request)."""
+        with self._lock:
+            self._close_locked()
+
+
+class PrefetchingBackend(CoordinationBackend):
+    """
+    Batching wrapper: claim a worker's whole batch of keys in one round trip.
+
+    Call ``prefetch(keys, ttl_ms, horizon_ms)`` when a batch of decisions is
+    pulled from the queue: leases are claimed for ``ttl_ms + horizon_ms``, so
+    every claim made within ``horizon_ms`` still has ``ttl_ms`` left and is
+    answered locally instead of one round trip per action. Set ``horizon_ms``
+    to how long the worker may take to reach the last decision of the batch.
+
+    Each prefetched lease is consumed by the first claim. A lease with less
+    than the requested ttl_ms left is renewed first, with one batched round
+    trip for all such keys. Keys that were not claimed at prefetch time are
+    not cached: their claim goes to the backend, so a key released by its
+    holder in the meantime is still picked up.
+    """
+
+    def __init__(
+        self, backend: CoordinationBackend, clock: Callable[[], int] | None = None
+    ) -> None:
+        super().__init__(backend.owner_id)
+        self.backend = backend
+        self._clock = clock or _now_ms
+        self._prefetched: dict[str, int] = {}  # claimed key -> local lease expiry (ms)
+        self._lock = threading.Lock()
+
+    def prefetch(
+        self, keys: Sequence[str], ttl_ms: int, horizon_ms: int | None = None
+    ) -> list[bool]:
+        """
+        Claim keys in one batch with headroom and cache the claimed ones.
+
+        Args:
+            keys: Idempotency keys for the batch
+            ttl_ms: Lease each claim needs (IdempotencyPolicy.lease_ttl_ms)
+            horizon_ms: Headroom for processing the batch (default: ttl_ms)
+
+        Returns:
+            Claim result per key (same order as keys)
+        """
+        lease_ms = ttl_ms + (ttl_ms if horizon_ms is None else horizon_ms)
+        # Read the clock before the round trip: the backend lease starts no earlier,
+        # so the local expiry never overestimates the real one
+        expires_ms = self._clock() + lease_ms
+        claimed = self.backend.claim_many(keys, lease_ms)
+        with self._lock:
+            for key, ok in zip(keys, claimed):
+                if ok:
+                    self._prefetched[key] = expires_ms
+                else:
+                    self._prefetched.pop(key, None)
+        return claimed
+
+    def claim_many(self, keys: Sequence[str], ttl_ms: int) -> list[bool]:
+        now_ms = self._clock()
+        results: dict[int, bool] = {}
+        short: list[int] = []
+        with self._lock:
+            for i, key in enumerate(keys):
+                expires_ms = self._prefetched.pop(key, None)
+                if expires_ms is None or expires_ms <= now_ms:
+                    continue
+                if expires_ms - now_ms < ttl_ms:
+                    short.append(i)
+                else:
+                    results[i] = True
+        if short:
+            renewed = self.backend.renew_many([keys[i] for i in short], ttl_ms)
+            # A lease that could not be renewed falls through to a fresh claim
+            results.update((i, True) for i, ok in zip(short, renewed) if ok)
+        missing = [i for i in range(len(keys)) if i not in results]
+        if missing:
+            claimed = self.backend.claim_many([keys[i] for i in missing], ttl_ms)
+            results.update(zip(missing, claimed))
+        return [results[i] for i in range(len(keys))]
+
+    def renew_many(self, keys: Sequence[str], ttl_ms: int) -> list[bool]:
+        return self.backend.renew_many(keys, ttl_ms)
+
+    def release_many(self, keys: Sequence[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._prefetched.pop(key, None)
+        self.backend.release_many(keys)
+
+
+class _LeaseRequestHandler(socketserver.StreamRequestHandler):
+    server: "_ThreadingLeaseServer"
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                response = self.server.lease_server.dispatch(json.loads(line))
+            except (ValueError, KeyError, TypeError):
+                response = {"ok": False, "error": "bad_request"}
+            self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+
+
+class _ThreadingLeaseServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    lease_server: "LeaseServer"
+
+
+class LeaseServer:
+    """
+    Local stand-in lease server for ``TcpLeaseBackend`` (tests and local development).
+
+    Usage:
+        with LeaseServer() as server:
+            backend = TcpLeaseBackend(*server.address)
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        clock: Callable[[], int] | None = None,
+    ) -> None:
+        self._clock = clock or _now_ms
+        self._leases: LeaseTable = {}
+        self._lock = threading.Lock()
+        self._server = _ThreadingLeaseServer((host, port), _LeaseRequestHandler)
+        self._server.lease_server = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Bound (host, port)."""
+        host, port = self._server.server_address[:2]
+        return str(host), int(port)
+
+    def dispatch(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Apply one protocol request to the lease table."""
+        op = request["op"]
+        keys = [str(k) for k in request["keys"]]
+        owner_id = str(request["owner"])
+        with self._lock:
+            if op == "claim":
+                ttl_ms = int(request["ttl_ms"])
+                claimed = _claim_leases(self._leases, keys, owner_id, ttl_ms, self._clock())
+                return {"ok": True, "claimed": claimed}
+            if op == "renew":
+                ttl_ms = int(request["ttl_ms"])
+                renewed = _renew_leases(self._leases, keys, owner_id, ttl_ms, self._clock())
+                return {"ok": True, "renewed": renewed}
+            if op == "release":
+                _release_leases(self._leases, keys, owner_id)
+                return {"ok": True}
+        return {"ok": False, "error": "unknown_op"}
+
+    def start(self) -> "LeaseServer":
+        """Serve in a daemon thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Stop serving and close the listening socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "LeaseServer":
+        return self.start()
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
@@ -0,0 +1,103 @@
+# Decision Ecosystem — execution-orchestration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Deterministic decision keys (INV-EXE-1)."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from decision_schema.types import FinalDecision
+
+logger = logging.getLogger(__name__)
+
+_fallback_warned = False
+
+
+def decision_key(final_decision: FinalDecision, context: dict[str, Any]) -> str:
+    """
+    Derive a stable key identifying a decision.
+
+    Uses ``context["decision_id"]`` when provided by the integration layer;
+    otherwise falls back to action + reasons + ``now_ms``. Never uses
+    ``hash()`` (salted per process), so the key is identical across workers.
+
+    The fallback has no per-decision entropy: decisions sharing action, reasons
+    and ``now_ms`` share one key (one shed bucket, one idempotency key), so
+    shedding for them is all-or-nothing. A warning is logged once per process.
+
+    Args:
+        final_decision: FinalDecision being executed
+        context: Execution context
+
+    Returns:
+        Decision key string
+    """
+    decision_id = context.get("decision_id")
+    if decision_id is not None and decision_id != "":
+        return str(decision_id)
+    global _fallback_warned
+    if not _fallback_warned:
+        _fallback_warned = True
+        logger.warning(
+            "decision_id missing: falling back to action+reasons+now_ms decision key "
+            "(decisions sharing these share one key; shedding is all-or-nothing for them, "
+            "and idempotency leasing requires decision_id)"
+        )
+    action = getattr(final_decision.action, "value", final_decision.action)
+    reasons = "|".join(str(r) for r in final_decision.reasons or ())
+    return f"{action}|{reasons}|{context.get('now_ms', '')}"
+
+
+def has_decision_identity(context: dict[str, Any], key_generator: str | None = None) -> bool:
+    """
+    Whether context identifies the decision itself (not the fallback key).
+
+    True if ``decision_id`` is set, or ``idempotency_key`` is set with
+    ``key_generator="custom"``. Shared idempotency leases require this: with the
+    fallback key, distinct decisions sharing action/reasons/now_ms would collide
+    and all but one would be skipped.
+
+    Args:
+        context: Execution context
+        key_generator: IdempotencyPolicy.key_generator
+
+    Returns:
+        True if a per-decision identity is present
+    """
+    if key_generator == "custom" and context.get("idempotency_key") not in (None, ""):
+        return True
+    return context.get("decision_id") not in (None, "")
+
+
+def idempotency_key(
+    final_decision: FinalDecision,
+    context: dict[str, Any],
+    key_generator: str | None = None,
+) -> str:
+    """
+    Derive the idempotency key for a decision.
+
+    Generators:
+    - ``"custom"``: ``context["idempotency_key"]`` (falls back to the default if absent)
+    - ``"action+context_hash"`` / ``None``: ``<action>:<sha256(decision_key)[:32]>``
+
+    Args:
+        final_decision: FinalDecision being executed
+        context: Execution context
+        key_generator: IdempotencyPolicy.key_generator
+
+    Returns:
+        Idempotency key string (stable across processes)
+    """
+    import hashlib  # deferred: only idempotency-enabled policies pay the import
+
+    if key_generator == "custom":
+        custom = context.get("idempotency_key")
+        if custom is not None and custom != "":
+            return str(custom)
+    action = getattr(final_decision.action, "value", final_decision.action)
+    digest = hashlib.sha256(decision_key(final_decision, context).encode("utf-8")).hexdigest()
+    return f"{action}:{digest[:32]}"
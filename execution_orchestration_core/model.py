@@ -3,11 +3,14 @@
 # SPDX-License-Identifier: MIT
 """Execution orchestration data models."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from decision_schema.types import Action
+if TYPE_CHECKING:  # annotation-only: keeps decision_schema off the import path
+    from decision_schema.types import Action
 
 
 class ExecutionStatus(str, Enum):
@@ -17,6 +20,7 @@ class ExecutionStatus(str, Enum):
     FAILED = "failed"
     SKIPPED = "skipped"
     DENIED = "denied"
+    SHED = "shed"
 
 
 @dataclass
@@ -28,7 +32,7 @@ class ExecutionAttempt:
     attempt_number: int
     latency_ms: int
     error_type: str | None = None  # e.g. type(e).__name__ or "executor_rejected"
-    error_code: str | None = None  # e.g. "executor_failed", "timeout", "execution_exception"
+    error_code: str | None = None  # e.g. "executor_failed", "execution_exception", "load_shed"
     error_message: str | None = None  # deprecated: do not set; use error_type/error_code
     idempotency_key: str | None = None
 
@@ -54,6 +58,7 @@ class ExecutionReport:
     failed_count: int = 0
     skipped_count: int = 0
     denied_count: int = 0
+    shed_count: int = 0
     fail_closed: bool = False
 
     def to_external_dict(self) -> dict[str, Any]:
@@ -68,6 +73,7 @@ class ExecutionReport:
             "exec.failed_count": self.failed_count,
             "exec.skipped_count": self.skipped_count,
             "exec.denied_count": self.denied_count,
+            "exec.shed_count": self.shed_count,
             "exec.fail_closed": self.fail_closed,
             "exec.attempt_count": len(self.attempts),
         }
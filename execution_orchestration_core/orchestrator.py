@@ -3,25 +3,68 @@
 # SPDX-License-Identifier: MIT
 """Execution orchestrator: main API (INV-EXE-1 through INV-EXE-6)."""
 
+from __future__ import annotations
+
 import logging
 import time
-from typing import Any, Callable
-
-from decision_schema.types import Action, FinalDecision
+from typing import TYPE_CHECKING, Any, Callable
 
+from execution_orchestration_core.keys import has_decision_identity, idempotency_key
 from execution_orchestration_core.model import (
     ExecutionAttempt,
     ExecutionPlan,
     ExecutionReport,
     ExecutionStatus,
 )
-from execution_orchestration_core.policies import ExecutionPolicy
+from execution_orchestration_core.shedding import should_shed
+
+if TYPE_CHECKING:  # annotation-only: keeps decision_schema off the import path
+    from decision_schema.types import Action, FinalDecision
+
+    from execution_orchestration_core.policies import ExecutionPolicy
 
 logger = logging.getLogger(__name__)
 
 
 # Type alias for action executor (domain-agnostic interface)
-ActionExecutor = Callable[[Action, dict[str, Any]], tuple[bool, str | None]]
+ActionExecutor = Callable[["Action", dict[str, Any]], tuple[bool, str | None]]
+
+
+def _gate_report(
+    final_decision: FinalDecision,
+    status: ExecutionStatus,
+    error_type: str,
+    error_code: str,
+    key: str | None = None,
+) -> ExecutionReport:
+    """
+    Build the report for a decision stopped before any executor call.
+
+    The single gate record (attempt_number=0, latency_ms=0) carries the error_code
+    and counts toward exec.attempt_count; the executor was not called. FAILED gates
+    are fail-closed (INV-EXE-3); SHED/SKIPPED gates are intentional.
+    """
+    report = ExecutionReport(
+        attempts=[
+            ExecutionAttempt(
+                action=final_decision.action,
+                status=status,
+                attempt_number=0,
+                latency_ms=0,
+                error_type=error_type,
+                error_code=error_code,
+                idempotency_key=key,
+            )
+        ]
+    )
+    if status == ExecutionStatus.SHED:
+        report.shed_count = 1
+    elif status == ExecutionStatus.SKIPPED:
+        report.skipped_count = 1
+    else:
+        report.failed_count = 1
+        report.fail_closed = True
+    return report
 
 
 def execute(
@@ -37,13 +80,13 @@ def execute(
     - INV-EXE-1: Deterministic (same input → same plan/ordering)
     - INV-EXE-2: Bounded (max_retries, max_total_time_ms, max_concurrency)
     - INV-EXE-3: Fail-closed (exception → failed/denied + marker)
-    - INV-EXE-4: Kill-switch compliance (ops kill-switch → deny)
+    - INV-EXE-4: Kill-switch compliance (ops kill-switch → deny; degraded → graded shed)
     - INV-EXE-5: Secret hygiene (redaction in logs/reports)
 
     Args:
         final_decision: FinalDecision to execute
         context: Execution context (includes ops-health signals)
-        policy: Execution policy (retry/timeout/idempotency)
+        policy: Execution policy (retry/timeout/idempotency/shedding)
         executor: Action executor function (domain-specific adapter)
 
     Returns:
@@ -66,6 +109,20 @@ def execute(
             fail_closed=False,
         )
 
+    # INV-EXE-4: Graded load shedding (deterministic per decision key, INV-EXE-1)
+    if policy.shedding.enabled:
+        try:
+            shed = should_shed(final_decision, context, policy.shedding)
+        except Exception as e:
+            # INV-EXE-3: Fail-closed when the shed decision cannot be made
+            logger.warning("Load shedding exception: %s", type(e).__name__)
+            return _gate_report(
+                final_decision, ExecutionStatus.FAILED, type(e).__name__, "shedding_failed"
+            )
+        if shed:
+            logger.info("Load shedding active: shedding execution")
+            return _gate_report(final_decision, ExecutionStatus.SHED, "ops_load_shed", "load_shed")
+
     # Build execution plan (INV-EXE-1: deterministic)
     plan = ExecutionPlan(
         actions=[final_decision.action],
@@ -75,6 +132,53 @@ def execute(
         idempotency_enabled=policy.idempotency.enabled,
     )
 
+    # INV-EXE-1: Idempotency key + shared claim across workers (one claim per decision)
+    key: str | None = None
+    backend = policy.idempotency.backend
+    if plan.idempotency_enabled:
+        try:
+            key = idempotency_key(final_decision, context, policy.idempotency.key_generator)
+            if backend is not None:
+                # Leasing the fallback key would make distinct decisions collide
+                if not has_decision_identity(context, policy.idempotency.key_generator):
+                    logger.warning("Idempotency lease requires decision_id: denying")
+                    return _gate_report(
+                        final_decision,
+                        ExecutionStatus.FAILED,
+                        "missing_decision_id",
+                        "idempotency_key_missing",
+                        key,
+                    )
+                # Lease must outlive the whole run, or another worker could take it mid-run
+                if policy.idempotency.lease_ttl_ms < policy.lease_budget_ms():
+                    logger.warning("Idempotency lease_ttl_ms below execution budget: denying")
+                    return _gate_report(
+                        final_decision,
+                        ExecutionStatus.FAILED,
+                        "policy_invalid",
+                        "lease_ttl_too_short",
+                        key,
+                    )
+                claimed = backend.claim(key, policy.idempotency.lease_ttl_ms)
+            else:
+                claimed = True
+        except Exception as e:
+            # INV-EXE-3: Fail-closed when the key cannot be derived or claimed
+            logger.warning("Idempotency exception: %s", type(e).__name__)
+            error_code = "idempotency_key_failed" if key is None else "coordination_failed"
+            return _gate_report(
+                final_decision, ExecutionStatus.FAILED, type(e).__name__, error_code, key
+            )
+        if not claimed:
+            logger.info("Idempotency key already leased: skipping execution")
+            return _gate_report(
+                final_decision,
+                ExecutionStatus.SKIPPED,
+                "idempotency_conflict",
+                "idempotency_conflict",
+                key,
+            )
+
     # Execute with retry/timeout (INV-EXE-2: bounded)
     report = ExecutionReport()
     start_time_ms = int(time.time() * 1000)
@@ -106,6 +210,7 @@ def execute(
                                 status=ExecutionStatus.SUCCESS,
                                 attempt_number=attempt_number,
                                 latency_ms=attempt_latency_ms,
+                                idempotency_key=key,
                             )
                         )
                         report.success_count += 1
@@ -126,6 +231,7 @@ def execute(
                                     latency_ms=attempt_latency_ms,
                                     error_code="executor_failed",
                                     error_type="executor_rejected",
+                                    idempotency_key=key,
                                 )
                             )
                             report.failed_count += 1
@@ -149,6 +255,7 @@ def execute(
                                 latency_ms=attempt_latency_ms,
                                 error_type=type(e).__name__,
                                 error_code="execution_exception",
+                                idempotency_key=key,
                             )
                         )
                         report.failed_count += 1
@@ -161,6 +268,13 @@ def execute(
         logger.error("Orchestrator exception: %s", type(e).__name__)
         report.fail_closed = True
 
+    # Release the lease on failure so another worker may retry the decision
+    if key is not None and backend is not None and report.success_count == 0:
+        try:
+            backend.release(key)
+        except Exception as e:
+            logger.warning("Idempotency release exception: %s", type(e).__name__)
+
     # Compute total latency
     end_time_ms = int(time.time() * 1000)
     report.total_latency_ms = end_time_ms - start_time_ms
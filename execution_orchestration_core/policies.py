@@ -1,9 +1,13 @@
 # Decision Ecosystem — execution-orchestration-core
 # Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
 # SPDX-License-Identifier: MIT
-"""Execution policies: retry, backoff, timeout, idempotency."""
+"""Execution policies: retry, backoff, timeout, idempotency, load shedding."""
 
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from execution_orchestration_core.coordination import CoordinationBackend
 
 
 @dataclass
@@ -45,6 +49,66 @@ class IdempotencyPolicy:
 
     enabled: bool = False
     key_generator: str | None = None  # "action+context_hash", "custom", etc.
+    backend: "CoordinationBackend | None" = None  # shared claim across workers (None: local only)
+    lease_ttl_ms: int = 60000  # must cover ExecutionPolicy.lease_budget_ms()
+
+
+def _ramp(value: Any, soft: float | None, hard: float | None) -> float:
+    """Linear ramp: 0.0 at/below soft, 1.0 at/above hard (0.0 if unconfigured/invalid)."""
+    if soft is None or hard is None or hard <= soft:
+        return 0.0
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return 0.0
+    if value <= soft:
+        return 0.0
+    if value >= hard:
+        return 1.0
+    return (value - soft) / (hard - soft)
+
+
+@dataclass
+class LoadSheddingPolicy:
+    """
+    Graded load shedding driven by ops-health context signals.
+
+    The shed ratio is the maximum of:
+    - ``ops_shed_ratio`` (explicit ratio from ops-health-core, 0.0-1.0)
+    - ``ops_queue_depth`` ramped between ``queue_depth_soft`` and ``queue_depth_hard``
+    - ``ops_error_rate`` ramped between ``error_rate_soft`` and ``error_rate_hard``
+
+    capped at ``max_shed_ratio``. Decisions with ``exec_priority >= protected_priority``
+    are never shed.
+    """
+
+    enabled: bool = False
+    queue_depth_soft: int | None = None
+    queue_depth_hard: int | None = None
+    error_rate_soft: float | None = None
+    error_rate_hard: float | None = None
+    max_shed_ratio: float = 1.0
+    protected_priority: int | None = None
+
+    def shed_ratio(self, context: dict[str, Any]) -> float:
+        """
+        Compute the share of decisions to shed from context signals.
+
+        Args:
+            context: Execution context (ops-health signals)
+
+        Returns:
+            Shed ratio in [0.0, max_shed_ratio]
+        """
+        explicit = context.get("ops_shed_ratio", 0.0)
+        if isinstance(explicit, bool) or not isinstance(explicit, (int, float)):
+            explicit = 0.0
+        ratio = max(
+            float(explicit),
+            _ramp(context.get("ops_queue_depth"), self.queue_depth_soft, self.queue_depth_hard),
+            _ramp(context.get("ops_error_rate"), self.error_rate_soft, self.error_rate_hard),
+        )
+        if ratio != ratio:  # NaN
+            return 0.0
+        return max(0.0, min(ratio, 1.0, self.max_shed_ratio))
 
 
 @dataclass
@@ -54,4 +118,22 @@ class ExecutionPolicy:
     retry: RetryPolicy = field(default_factory=RetryPolicy)
     timeout: TimeoutPolicy = field(default_factory=TimeoutPolicy)
     idempotency: IdempotencyPolicy = field(default_factory=IdempotencyPolicy)
+    shedding: LoadSheddingPolicy = field(default_factory=LoadSheddingPolicy)
     max_concurrency: int = 1  # Sequential execution by default
+
+    def lease_budget_ms(self) -> int:
+        """
+        Longest time an idempotency lease must stay live for one execute() call.
+
+        The last attempt may start just before max_total_time_ms and run for
+        timeout_per_action_ms; a backoff sleep (up to max_backoff_ms) may precede
+        the final deadline check. Assumes executors honor timeout_per_action_ms.
+
+        Returns:
+            Lease budget in milliseconds
+        """
+        return (
+            self.timeout.max_total_time_ms
+            + self.timeout.timeout_per_action_ms
+            + self.retry.max_backoff_ms
+        )
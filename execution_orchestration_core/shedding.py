@@ -0,0 +1,67 @@
+# Decision Ecosystem — execution-orchestration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Load shedding: deterministic per-decision shed gating (INV-EXE-1)."""
+
+from __future__ import annotations
+
+import zlib
+from typing import TYPE_CHECKING, Any
+
+from execution_orchestration_core.keys import decision_key
+
+if TYPE_CHECKING:
+    from decision_schema.types import FinalDecision
+
+    from execution_orchestration_core.policies import LoadSheddingPolicy
+
+_BUCKET_SCALE = float(1 << 32)
+
+
+def shed_bucket(key: str) -> float:
+    """
+    Map a decision key to a stable bucket in [0.0, 1.0).
+
+    CRC32 is used (not ``hash()``) so every process agrees on the bucket.
+
+    Args:
+        key: Decision key
+
+    Returns:
+        Bucket value in [0.0, 1.0)
+    """
+    return zlib.crc32(key.encode("utf-8")) / _BUCKET_SCALE
+
+
+def should_shed(
+    final_decision: FinalDecision,
+    context: dict[str, Any],
+    policy: LoadSheddingPolicy,
+) -> bool:
+    """
+    Decide whether to shed a decision under current ops-health signals.
+
+    A decision is shed iff its bucket falls below the shed ratio, so the same
+    decision key under the same signals always yields the same outcome, and
+    raising the ratio only ever sheds a superset of decisions.
+
+    Args:
+        final_decision: FinalDecision to execute
+        context: Execution context (ops-health signals, optional decision_id/exec_priority)
+        policy: Load shedding policy
+
+    Returns:
+        True if the decision should be shed
+    """
+    if not policy.enabled:
+        return False
+    ratio = policy.shed_ratio(context)
+    if ratio <= 0.0:
+        return False
+    if policy.protected_priority is not None:
+        priority = context.get("exec_priority")
+        if isinstance(priority, (int, float)) and priority >= policy.protected_priority:
+            return False
+    if ratio >= 1.0:
+        return True
+    return shed_bucket(decision_key(final_decision, context)) < ratio
@@ -0,0 +1,387 @@
+# Decision Ecosystem — execution-orchestration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""INV-EXE-1 / INV-EXE-3: Multi-worker idempotency coordination tests."""
+
+import multiprocessing
+import threading
+from collections.abc import Sequence
+
+from decision_schema.types import Action, FinalDecision
+
+from execution_orchestration_core.coordination import (
+    CoordinationBackend,
+    FileLeaseBackend,
+    InMemoryLeaseBackend,
+    LeaseServer,
+    PrefetchingBackend,
+    TcpLeaseBackend,
+)
+from execution_orchestration_core.model import ExecutionStatus
+from execution_orchestration_core.orchestrator import execute
+from execution_orchestration_core.policies import ExecutionPolicy, IdempotencyPolicy
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now_ms = 1000
+
+    def __call__(self) -> int:
+        return self.now_ms
+
+
+class _CountingBackend(CoordinationBackend):
+    """Wraps a backend and counts round trips."""
+
+    def __init__(self, backend: CoordinationBackend) -> None:
+        super().__init__(backend.owner_id)
+        self.backend = backend
+        self.round_trips = 0
+
+    def claim_many(self, keys: Sequence[str], ttl_ms: int) -> list[bool]:
+        self.round_trips += 1
+        return self.backend.claim_many(keys, ttl_ms)
+
+    def renew_many(self, keys: Sequence[str], ttl_ms: int) -> list[bool]:
+        self.round_trips += 1
+        return self.backend.renew_many(keys, ttl_ms)
+
+    def release_many(self, keys: Sequence[str]) -> None:
+        self.round_trips += 1
+        self.backend.release_many(keys)
+
+
+def _claim_all(path: str, keys: list[str]) -> list[bool]:
+    return FileLeaseBackend(path).claim_many(keys, ttl_ms=60000)
+
+
+def test_inv_exe_1_in_memory_lease_claim_renew_expire() -> None:
+    """Live leases are never re-claimed (even by the owner); renew extends; expiry frees."""
+    clock = _FakeClock()
+    backend = InMemoryLeaseBackend(owner_id="w1", clock=clock)
+
+    assert backend.claim("k", ttl_ms=100) is True
+    assert backend.claim("k", ttl_ms=100) is False  # same owner: still a duplicate
+    clock.now_ms += 50
+    assert backend.renew("k", ttl_ms=100) is True  # now expires at +150
+
+    backend.owner_id = "w2"
+    assert backend.renew("k", ttl_ms=100) is False  # not ours
+    clock.now_ms += 99
+    assert backend.claim("k", ttl_ms=100) is False
+    clock.now_ms += 1
+    assert backend.claim("k", ttl_ms=100) is True  # expired lease taken over
+
+
+def test_inv_exe_1_file_lease_exclusive_across_owners(tmp_path) -> None:
+    """Two workers sharing a lease file: only one claims each key; release frees it."""
+    path = tmp_path / "leases.json"
+    w1 = FileLeaseBackend(path, owner_id="w1")
+    w2 = FileLeaseBackend(path, owner_id="w2")
+
+    assert w1.claim_many(["a", "b"], ttl_ms=60000) == [True, True]
+    assert w2.claim_many(["a", "b", "c"], ttl_ms=60000) == [False, False, True]
+
+    w2.release("a")  # not held by w2: no-op
+    assert w2.claim("a", ttl_ms=60000) is False
+    w1.release("a")
+    assert w2.claim("a", ttl_ms=60000) is True
+
+
+def test_inv_exe_1_file_lease_multi_process_race(tmp_path) -> None:
+    """Processes racing on the same keys: every key is claimed exactly once."""
+    path = str(tmp_path / "leases.json")
+    keys = [f"k{i}" for i in range(20)]
+
+    with multiprocessing.get_context("spawn").Pool(4) as pool:
+        results = pool.starmap(_claim_all, [(path, keys)] * 4)
+
+    for i in range(len(keys)):
+        assert sum(r[i] for r in results) == 1
+
+
+def test_inv_exe_1_tcp_lease_backend_against_local_server() -> None:
+    """Network backend against the local stand-in server."""
+    with LeaseServer() as server:
+        w1 = TcpLeaseBackend(*server.address, owner_id="w1")
+        w2 = TcpLeaseBackend(*server.address, owner_id="w2")
+        try:
+            assert w1.claim_many(["a", "b"], ttl_ms=60000) == [True, True]
+            assert w2.claim_many(["a", "c"], ttl_ms=60000) == [False, True]
+            assert w1.renew_many(["a", "c"], ttl_ms=60000) == [True, False]
+            w1.release_many(["a"])
+            assert w2.claim("a", ttl_ms=60000) is True
+        finally:
+            w1.close()
+            w2.close()
+
+
+def test_inv_exe_1_prefetch_one_round_trip_per_batch() -> None:
+    """Prefetched claims are answered locally: one round trip for the whole batch."""
+    clock = _FakeClock()
+    counting = _CountingBackend(InMemoryLeaseBackend(owner_id="w1", clock=clock))
+    backend = PrefetchingBackend(counting, clock=clock)
+    policy = ExecutionPolicy(
+        idempotency=IdempotencyPolicy(enabled=True, key_generator="custom", backend=backend),
+    )
+
+    def executor(_action: Action, _context: dict) -> tuple[bool, str | None]:
+        clock.now_ms += 250  # time passes between decisions of the batch
+        return True, None
+
+    final_decision = FinalDecision(action=Action.ACT, allowed=True, reasons=["test"])
+    contexts = [{"idempotency_key": f"k{i}"} for i in range(10)]
+
+    backend.prefetch([c["idempotency_key"] for c in contexts], policy.idempotency.lease_ttl_ms)
+    reports = [execute(final_decision, c, policy, executor) for c in contexts]
+
+    assert counting.round_trips == 1
+    assert all(r.success_count == 1 for r in reports)
+
+
+def test_inv_exe_1_second_worker_skips_claimed_decision(tmp_path) -> None:
+    """Two workers handed the same decision: exactly one executes it."""
+    path = tmp_path / "leases.json"
+    calls = []
+
+    def executor(action: Action, _context: dict) -> tuple[bool, str | None]:
+        calls.append(action)
+        return True, None
+
+    final_decision = FinalDecision(action=Action.ACT, allowed=True, reasons=["test"])
+    context = {"decision_id": "d-42"}
+    reports = [
+        execute(
+            final_decision,
+            context,
+            ExecutionPolicy(
+                idempotency=IdempotencyPolicy(
+                    enabled=True, backend=FileLeaseBackend(path, owner_id=owner)
+                )
+            ),
+            executor,
+        )
+        for owner in ("w1", "w2")
+    ]
+
+    assert len(calls) == 1
+    assert reports[0].success_count == 1
+    assert reports[1].skipped_count == 1
+    assert reports[1].attempts[0].status == ExecutionStatus.SKIPPED
+    assert reports[1].attempts[0].error_code == "idempotency_conflict"
+    assert reports[1].attempts[0].idempotency_key == reports[0].attempts[0].idempotency_key
+
+
+def test_inv_exe_1_failed_execution_releases_lease() -> None:
+    """Final failure releases the lease so another worker may retry."""
+    backend = InMemoryLeaseBackend(owner_id="w1")
+    policy = ExecutionPolicy(
+        idempotency=IdempotencyPolicy(enabled=True, key_generator="custom", backend=backend),
+    )
+    policy.retry.max_retries = 0
+
+    def failing_executor(_action: Action, _context: dict) -> tuple[bool, str | None]:
+        return False, "fail"
+
+    final_decision = FinalDecision(action=Action.ACT, allowed=True, reasons=["test"])
+    report = execute(final_decision, {"idempotency_key": "k"}, policy, failing_executor)
+
+    assert report.failed_count == 1
+    backend.owner_id = "w2"
+    assert backend.claim("k", ttl_ms=1000) is True
+
+
+def test_inv_exe_3_coordination_failure_fails_closed() -> None:
+    """Unreachable coordination backend → fail-closed, executor not called."""
+    with LeaseServer() as server:
+        host, port = server.address
+    backend = TcpLeaseBackend(host, port, timeout_s=0.5)  # server closed
+    policy = ExecutionPolicy(idempotency=IdempotencyPolicy(enabled=True, backend=backend))
+    calls = []
+
+    def executor(action: Action, _context: dict) -> tuple[bool, str | None]:
+        calls.append(action)
+        return True, None
+
+    final_decision = FinalDecision(action=Action.ACT, allowed=True, reasons=["test"])
+    report = execute(final_decision, {"decision_id": "d-1"}, policy, executor)
+
+    assert calls == []
+    assert report.fail_closed is True
+    assert report.attempts[0].error_code == "coordination_failed"
+
+
+def test_inv_exe_1_prefetched_lease_renewed_when_short() -> None:
+    """A prefetched lease with less than ttl_ms left is renewed (one batched round trip)."""
+    clock = _FakeClock()
+    counting = _CountingBackend(InMemoryLeaseBackend(owner_id="w1", clock=clock))
+    backend = PrefetchingBackend(counting, clock=clock)
+
+    backend.prefetch(["a", "b"], ttl_ms=1000, horizon_ms=0)
+    clock.now_ms += 500
+    assert backend.claim_many(["a", "b"], ttl_ms=1000) == [True, True]
+    assert counting.round_trips == 2  # prefetch + one renew batch
+
+    clock.now_ms += 900  # renewed lease (expires at +1500) still live
+    assert counting.backend.claim("a", ttl_ms=1000) is False
+
+
+def test_inv_exe_1_sequential_redelivery_in_one_worker_skipped() -> None:
+    """Same decision delivered twice to one worker (default owner): executed once."""
+    backend = InMemoryLeaseBackend()
+    policy = ExecutionPolicy(idempotency=IdempotencyPolicy(enabled=True, backend=backend))
+    calls = []
+
+    def executor(action: Action, _context: dict) -> tuple[bool, str | None]:
+        calls.append(action)
+        return True, None
+
+    final_decision = FinalDecision(action=Action.ACT, allowed=True, reasons=["test"])
+    context = {"decision_id": "d-7"}
+
+    first = execute(final_decision, context, policy, executor)
+    second = execute(final_decision, dict(context), policy, executor)
+
+    assert len(calls) == 1
+    assert first.success_count == 1
+    assert second.skipped_count == 1
+    assert second.attempts[0].error_code == "idempotency_conflict"
+
+
+def test_inv_exe_1_concurrent_threads_in_one_worker_execute_once(tmp_path) -> None:
+    """Threads in one process handed the same decision: exactly one executes it."""
+    for backend in (InMemoryLeaseBackend(), FileLeaseBackend(tmp_path / "leases.json")):
+        policy = ExecutionPolicy(idempotency=IdempotencyPolicy(enabled=True, backend=backend))
+        calls = []
+        calls_lock = threading.Lock()
+        barrier = threading.Barrier(4)
+
+        def executor(action: Action, _context: dict) -> tuple[bool, str | None]:
+            with calls_lock:
+                calls.append(action)
+            return True, None
+
+        final_decision = FinalDecision(action=Action.ACT, allowed=True, reasons=["test"])
+        reports = []
+
+        def worker() -> None:
+            barrier.wait()
+            reports.append(execute(final_decision, {"decision_id": "d-9"}, policy, executor))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert sum(r.success_count for r in reports) == 1
+        assert sum(r.skipped_count for r in reports) == 3
+
+
+def test_inv_exe_3_unprintable_custom_key_fails_closed() -> None:
+    """custom idempotency_key whose str() raises → fail-closed, executor not called."""
+
+    class BadKey:
+        def __str__(self) -> str:
+            raise ValueError("unprintable")
+
+    policy = ExecutionPolicy(
+        idempotency=IdempotencyPolicy(
+            enabled=True, key_generator="custom", backend=InMemoryLeaseBackend()
+        )
+    )
+    calls = []
+
+    def executor(action: Action, _context: dict) -> tuple[bool, str | None]:
+        calls.append(action)
+        return True, None
+
+    final_decision = FinalDecision(action=Action.ACT, allowed=True, reasons=["test"])
+    report = execute(final_decision, {"idempotency_key": BadKey()}, policy, executor)
+
+    assert calls == []
+    assert report.fail_closed is True
+    assert report.attempts[0].error_code == "idempotency_key_failed"
+
+
+def test_inv_exe_1_lease_ttl_below_execution_budget_fails_closed() -> None:
+    """lease_ttl_ms shorter than the execution budget → fail-closed before claiming."""
+    backend = InMemoryLeaseBackend()
+    policy = ExecutionPolicy(
+        idempotency=IdempotencyPolicy(enabled=True, backend=backend, lease_ttl_ms=1000),
+    )
+    assert policy.lease_budget_ms() > 1000
+    calls = []
+
+    def executor(action: Action, _context: dict) -> tuple[bool, str | None]:
+        calls.append(action)
+        return True, None
+
+    final_decision = FinalDecision(action=Action.ACT, allowed=True, reasons=["test"])
+    report = execute(final_decision, {"decision_id": "d-1"}, policy, executor)
+
+    assert calls == []
+    assert report.fail_closed is True
+    assert report.attempts[0].error_code == "lease_ttl_too_short"
+    assert backend.claim(report.attempts[0].idempotency_key, ttl_ms=1000) is True  # never claimed
+
+
+def test_inv_exe_1_default_lease_ttl_covers_default_budget() -> None:
+    """Default policies are consistent: lease_ttl_ms >= lease_budget_ms()."""
+    policy = ExecutionPolicy()
+    assert policy.idempotency.lease_ttl_ms >= policy.lease_budget_ms()
+
+
+def test_inv_exe_1_prefetch_expiry_read_before_round_trip() -> None:
+    """Local expiry is computed before the claim round trip (never overestimates the lease)."""
+    clock = _FakeClock()
+
+    class SlowBackend(_CountingBackend):
+        def claim_many(self, keys: Sequence[str], ttl_ms: int) -> list[bool]:
+            clock.now_ms += 100  # slow round trip
+            return super().claim_many(keys, ttl_ms)
+
+    counting = SlowBackend(InMemoryLeaseBackend(owner_id="w1", clock=clock))
+    backend = PrefetchingBackend(counting, clock=clock)
+
+    backend.prefetch(["a"], ttl_ms=1000, horizon_ms=0)
+    assert backend.claim("a", ttl_ms=1000) is True
+    assert counting.round_trips == 2  # only 900 ms known left locally → renewed
+
+
+def test_inv_exe_1_prefetch_rechecks_keys_not_claimed() -> None:
+    """A key held elsewhere at prefetch time is re-checked once its holder releases it."""
+    shared = InMemoryLeaseBackend(owner_id="w1")
+    shared.claim("a", ttl_ms=60000)
+    counting = _CountingBackend(shared)
+    counting.owner_id = "w2"
+    backend = PrefetchingBackend(counting)
+
+    assert backend.prefetch(["a"], ttl_ms=1000) == [False]
+    shared.release("a")  # holder failed and released
+    shared.owner_id = "w2"
+    assert backend.claim("a", ttl_ms=1000) is True
+
+
+def test_inv_exe_1_lease_without_decision_id_fails_closed() -> None:
+    """Backend set, no decision_id: distinct decisions are not collapsed; fail closed."""
+    policy = ExecutionPolicy(
+        idempotency=IdempotencyPolicy(enabled=True, backend=InMemoryLeaseBackend())
+    )
+    calls = []
+
+    def executor(action: Action, _context: dict) -> tuple[bool, str | None]:
+        calls.append(action)
+        return True, None
+
+    final_decision = FinalDecision(action=Action.ACT, allowed=True, reasons=["test"])
+    reports = [
+        execute(final_decision, {"payload": payload}, policy, executor) for payload in (1, 2)
+    ]
+
+    assert calls == []
+    for report in reports:
+        assert report.fail_closed is True
+        assert report.skipped_count == 0
+        assert report.attempts[0].error_code == "idempotency_key_missing"
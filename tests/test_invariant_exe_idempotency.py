@@ -23,9 +23,12 @@ def test_inv_exe_5_idempotency_key_generation() -> None:
 
     report = execute(final_decision, context, policy, executor)
 
-    # Should have idempotency keys in attempts (when implemented)
-    # For now, just verify execution succeeds
     assert report.success_count > 0
+    assert all(attempt.idempotency_key for attempt in report.attempts)
+
+    # Same decision → same key (INV-EXE-1)
+    again = execute(final_decision, dict(context), policy, executor)
+    assert again.attempts[0].idempotency_key == report.attempts[0].idempotency_key
 
 
 def test_inv_exe_5_idempotency_disabled_no_keys() -> None:
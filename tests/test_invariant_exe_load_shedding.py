@@ -0,0 +1,187 @@
+# Decision Ecosystem — execution-orchestration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""INV-EXE-4 / INV-EXE-1: Graded load shedding tests."""
+
+from decision_schema.types import Action, FinalDecision
+
+from execution_orchestration_core.model import ExecutionStatus
+from execution_orchestration_core.orchestrator import execute
+from execution_orchestration_core.policies import ExecutionPolicy, LoadSheddingPolicy
+from execution_orchestration_core.shedding import should_shed
+
+
+def _executor(_action: Action, _context: dict) -> tuple[bool, str | None]:
+    return True, None
+
+
+def test_inv_exe_4_shedding_disabled_by_default() -> None:
+    """Shedding is off by default: shed signals alone do not skip execution."""
+    final_decision = FinalDecision(action=Action.ACT, allowed=True, reasons=["test"])
+    context = {"ops_shed_ratio": 1.0}
+
+    report = execute(final_decision, context, ExecutionPolicy(), _executor)
+
+    assert report.success_count == 1
+    assert report.shed_count == 0
+
+
+def test_inv_exe_4_full_shed_ratio_sheds_with_marker() -> None:
+    """Shed ratio 1.0 sheds with distinct status/error_code and no executor call."""
+    policy = ExecutionPolicy(shedding=LoadSheddingPolicy(enabled=True))
+    calls = []
+
+    def executor(action: Action, _context: dict) -> tuple[bool, str | None]:
+        calls.append(action)
+        return True, None
+
+    final_decision = FinalDecision(action=Action.ACT, allowed=True, reasons=["test"])
+    context = {"ops_shed_ratio": 1.0, "decision_id": "d-1"}
+
+    report = execute(final_decision, context, policy, executor)
+
+    assert calls == []
+    assert report.shed_count == 1
+    assert report.fail_closed is False
+    assert len(report.attempts) == 1
+    assert report.attempts[0].status == ExecutionStatus.SHED
+    assert report.attempts[0].error_code == "load_shed"
+    assert report.to_external_dict()["exec.shed_count"] == 1
+
+
+def test_inv_exe_1_shedding_deterministic_per_decision_key() -> None:
+    """Same decision key + same signals → same shed outcome; ratio approximates share."""
+    policy = LoadSheddingPolicy(enabled=True)
+    final_decision = FinalDecision(action=Action.ACT, allowed=True, reasons=["test"])
+
+    outcomes = []
+    for i in range(2000):
+        context = {"ops_shed_ratio": 0.25, "decision_id": f"d-{i}"}
+        first = should_shed(final_decision, context, policy)
+        assert should_shed(final_decision, dict(context), policy) is first
+        outcomes.append(first)
+
+    share = sum(outcomes) / len(outcomes)
+    assert 0.2 < share < 0.3
+
+
+def test_inv_exe_1_shedding_monotonic_in_ratio() -> None:
+    """Raising the shed ratio only sheds a superset of decisions."""
+    policy = LoadSheddingPolicy(enabled=True)
+    final_decision = FinalDecision(action=Action.ACT, allowed=True, reasons=["test"])
+
+    for i in range(500):
+        low = {"ops_shed_ratio": 0.3, "decision_id": f"d-{i}"}
+        high = {"ops_shed_ratio": 0.6, "decision_id": f"d-{i}"}
+        if should_shed(final_decision, low, policy):
+            assert should_shed(final_decision, high, policy)
+
+
+def test_inv_exe_4_queue_depth_and_error_rate_ramp() -> None:
+    """Queue depth / error rate ramp linearly between soft and hard thresholds."""
+    policy = LoadSheddingPolicy(
+        enabled=True,
+        queue_depth_soft=100,
+        queue_depth_hard=200,
+        error_rate_soft=0.1,
+        error_rate_hard=0.5,
+        max_shed_ratio=0.9,
+    )
+
+    assert policy.shed_ratio({}) == 0.0
+    assert policy.shed_ratio({"ops_queue_depth": 50}) == 0.0
+    assert policy.shed_ratio({"ops_queue_depth": 150}) == 0.5
+    assert policy.shed_ratio({"ops_queue_depth": 1000}) == 0.9  # capped
+    assert abs(policy.shed_ratio({"ops_error_rate": 0.2}) - 0.25) < 1e-9
+    assert policy.shed_ratio({"ops_queue_depth": 150, "ops_error_rate": 0.4}) > 0.5
+    assert policy.shed_ratio({"ops_queue_depth": "bad", "ops_shed_ratio": None}) == 0.0
+
+
+def test_inv_exe_4_protected_priority_never_shed() -> None:
+    """Decisions at/above protected_priority are never shed."""
+    policy = ExecutionPolicy(shedding=LoadSheddingPolicy(enabled=True, protected_priority=5))
+    final_decision = FinalDecision(action=Action.ACT, allowed=True, reasons=["test"])
+
+    protected = execute(
+        final_decision, {"ops_shed_ratio": 1.0, "exec_priority": 5}, policy, _executor
+    )
+    shed = execute(final_decision, {"ops_shed_ratio": 1.0, "exec_priority": 1}, policy, _executor)
+
+    assert protected.success_count == 1
+    assert shed.shed_count == 1
+
+
+def test_inv_exe_4_kill_switch_precedes_shedding() -> None:
+    """Kill-switch deny takes precedence over shedding."""
+    policy = ExecutionPolicy(shedding=LoadSheddingPolicy(enabled=True))
+    final_decision = FinalDecision(action=Action.ACT, allowed=True, reasons=["test"])
+    context = {"ops_deny_actions": True, "ops_shed_ratio": 1.0}
+
+    report = execute(final_decision, context, policy, _executor)
+
+    assert report.denied_count == 1
+    assert report.shed_count == 0
+
+
+def test_inv_exe_4_fallback_key_without_decision_id_is_all_or_nothing(monkeypatch, caplog) -> None:
+    """Without decision_id/now_ms every same-action decision shares one bucket (warned once)."""
+    from execution_orchestration_core import keys
+
+    monkeypatch.setattr(keys, "_fallback_warned", False)
+    policy = LoadSheddingPolicy(enabled=True)
+    final_decision = FinalDecision(action=Action.ACT, allowed=True, reasons=["test"])
+
+    with caplog.at_level("WARNING", logger="execution_orchestration_core.keys"):
+        outcomes = {
+            should_shed(final_decision, {"ops_shed_ratio": 0.5}, policy) for _ in range(100)
+        }
+
+    assert len(outcomes) == 1  # all shed or none: no per-decision entropy
+    warnings = [r for r in caplog.records if "decision_id missing" in r.getMessage()]
+    assert len(warnings) == 1
+
+
+def test_inv_exe_3_shed_key_error_fails_closed() -> None:
+    """Error while deriving the shed key → fail-closed report, executor not called."""
+
+    class BadId:
+        def __str__(self) -> str:
+            raise ValueError("unprintable")
+
+    policy = ExecutionPolicy(shedding=LoadSheddingPolicy(enabled=True))
+    calls = []
+
+    def executor(action: Action, _context: dict) -> tuple[bool, str | None]:
+        calls.append(action)
+        return True, None
+
+    final_decision = FinalDecision(action=Action.ACT, allowed=True, reasons=["test"])
+    context = {"ops_shed_ratio": 0.5, "decision_id": BadId()}
+
+    report = execute(final_decision, context, policy, executor)
+
+    assert calls == []
+    assert report.fail_closed is True
+    assert report.failed_count == 1
+    assert report.attempts[0].status == ExecutionStatus.FAILED
+    assert report.attempts[0].error_code == "shedding_failed"
+
+
+def test_inv_exe_4_shed_gate_record_counted_without_executor_call() -> None:
+    """Shed gate: one gate record (attempt_number=0, latency_ms=0) and zero executor calls."""
+    policy = ExecutionPolicy(shedding=LoadSheddingPolicy(enabled=True))
+    calls = []
+
+    def executor(action: Action, _context: dict) -> tuple[bool, str | None]:
+        calls.append(action)
+        return True, None
+
+    final_decision = FinalDecision(action=Action.ACT, allowed=True, reasons=["test"])
+    report = execute(final_decision, {"ops_shed_ratio": 1.0, "decision_id": "d"}, policy, executor)
+
+    external = report.to_external_dict()
+    assert calls == []
+    assert external["exec.attempt_count"] == 1
+    assert external["exec.shed_count"] == 1
+    assert report.attempts[0].attempt_number == 0
+    assert report.attempts[0].latency_ms == 0
@@ -0,0 +1,74 @@
+# Decision Ecosystem — execution-orchestration-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Cold-start tests: lazy package import (minimal startup for short-lived workers)."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import execution_orchestration_core
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _new_modules_after(statement: str) -> set[str]:
+    """Run statement in a fresh interpreter; return modules it newly imported."""
+    script = (
+        "import json, sys\n"
+        "before = set(sys.modules)\n"
+        f"{statement}\n"
+        "print(json.dumps(sorted(set(sys.modules) - before)))\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=REPO_ROOT,
+    )
+    return set(json.loads(proc.stdout))
+
+
+def test_package_import_is_lazy() -> None:
+    """Importing the package loads no submodules, decision_schema, or logging."""
+    new = _new_modules_after("import execution_orchestration_core")
+
+    assert "execution_orchestration_core.orchestrator" not in new
+    assert "execution_orchestration_core.coordination" not in new
+    assert "decision_schema" not in new
+    assert "logging" not in new
+
+
+def test_execute_path_skips_optional_modules() -> None:
+    """Resolving execute() does not import decision_schema or coordination backends."""
+    new = _new_modules_after("from execution_orchestration_core import execute")
+
+    assert "execution_orchestration_core.orchestrator" in new
+    assert "execution_orchestration_core.coordination" not in new
+    assert "decision_schema" not in new
+    assert "socket" not in new
+
+
+def test_lazy_exports_resolve() -> None:
+    """Every lazy export resolves to the submodule attribute and is listed in dir()."""
+    from execution_orchestration_core.orchestrator import execute
+
+    lazy_exports = execution_orchestration_core._LAZY_EXPORTS
+    assert len(execution_orchestration_core.__all__) == len(
+        set(execution_orchestration_core.__all__)
+    )
+    assert set(execution_orchestration_core.__all__) == {"__version__", *lazy_exports}
+    for name in execution_orchestration_core.__all__:
+        assert getattr(execution_orchestration_core, name) is not None
+        assert name in dir(execution_orchestration_core)
+    assert execution_orchestration_core.execute is execute
+
+
+def test_unknown_attribute_raises() -> None:
+    """Unknown names raise AttributeError (not ImportError)."""
+    with pytest.raises(AttributeError):
+        execution_orchestration_core.does_not_exist  # noqa: B018